@@ -19,10 +19,10 @@ def main():
     
     # Phoneme strings for testing
     test_phonemes = [
-        ("utf-8", "kon'nichiwa"),  # こんにちは
-        ("utf-8", "arigatou"),     # ありがとう
-        ("utf-8", "sayounara"),    # さようなら
-        ("sjis", "おはよう"),        # おはよう (Shift-JIS)
+        ("utf-8", "こんにちわ。"),    # こんにちは
+        ("utf-8", "ありがとー。"),    # ありがとう
+        ("utf-8", "さよーなら。"),    # さようなら
+        ("sjis", "おはよー。"),       # おはよう (Shift-JIS)
     ]
     
     try:
@@ -78,7 +78,7 @@ def main():
         print(f"{'='*40}")
         
         output_file = "direct_output.wav"
-        if synth.synthesize_to_file("konbanwa", output_file, speed=120):
+        if synth.synthesize_to_file("こんばんわ。", output_file, speed=120):
             print(f"✓ Direct save successful: {output_file}")
         
         print(f"\n{'='*40}")
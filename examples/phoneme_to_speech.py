@@ -49,36 +49,37 @@ def full_text_to_speech():
         synth = PhonemeToSpeech(AT_DLL_PATH)
         print("   ✓ AquesTalk initialized")
         
-        # Process each text
-        for i, text in enumerate(japanese_texts, 1):
+        # Step 3: Build the pipeline (conversion of the next sentence
+        # overlaps synthesis of the current one; results are memoized)
+        from aquestalk import TextToSpeechPipeline, save_wav
+        pipeline = TextToSpeechPipeline(k2k, synth, speed=100)
+        
+        # Process all texts; a failed sentence yields its exception so
+        # the remaining sentences are still processed
+        results = pipeline.run(japanese_texts, return_exceptions=True)
+        for i, (text, audio) in enumerate(zip(japanese_texts, results), 1):
             print(f"\n{'='*40}")
-            print(f"Processing text {i}: {text}")
+            print(f"Text {i}: {text}")
             print(f"{'='*40}")
             
-            try:
-                # Convert text to phonemes
-                print("   Converting text to phonemes...")
-                phonemes = k2k.convert(text, encoding='utf-8')
-                print(f"   Phonemes: {phonemes}")
-                
-                # Synthesize phonemes to speech
-                print("   Synthesizing speech...")
-                audio = synth.synthesize(phonemes, speed=100)
-                print(f"   Audio: {audio.duration:.2f}s, {len(audio.data):,} bytes")
-                
-                # Save result
-                filename = f"output_{i}.wav"
-                from aquestalk import save_wav
-                save_wav(filename, audio)
-                print(f"   ✓ Saved as: {filename}")
-                
-                # Optional: Play the audio
-                # print("   Playing audio...")
-                # from aquestalk import play_audio
-                # play_audio(audio)
-                
-            except Exception as e:
-                print(f"   ✗ Failed: {e}")
+            if isinstance(audio, Exception):
+                print(f"   ✗ Failed: {audio}")
+                continue
+            
+            print(f"   Audio: {audio.duration:.2f}s, {len(audio.data):,} bytes")
+            
+            # Save result
+            filename = f"output_{i}.wav"
+            save_wav(filename, audio)
+            print(f"   ✓ Saved as: {filename}")
+            
+            # Optional: Play the audio
+            # print("   Playing audio...")
+            # from aquestalk import play_audio
+            # play_audio(audio)
+        
+        print(f"\n   Phoneme cache: {pipeline.cache.hits} hits, "
+              f"{pipeline.cache.misses} misses")
         
         # Cleanup
         print(f"\n{'='*40}")
@@ -105,10 +106,10 @@ def standalone_synthesis():
         
         # Common phoneme strings
         phoneme_examples = [
-            ("kon'nichiwa", "Hello"),
-            ("ohayou", "Good morning"),
-            ("konbanwa", "Good evening"),
-            ("oyasumi", "Good night"),
+            ("こんにちわ。", "Hello"),
+            ("おはよー。", "Good morning"),
+            ("こんばんわ。", "Good evening"),
+            ("おやすみ。", "Good night"),
         ]
         
         for phonemes, description in phoneme_examples:
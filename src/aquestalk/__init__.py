@@ -3,7 +3,11 @@ AquesTalk - Python wrapper for AquesTalk speech synthesis engine.
 """
 
 from .core import AquesTalk, AquesTalkError, AquesAudio
-from .audio import save_wav, play_audio, audio_to_numpy
+from .audio import (save_wav, play_audio, audio_to_numpy, numpy_to_audio,
+                    PostProcessor, trim_silence, normalize_loudness, apply_fade)
+from .pipeline import TextToSpeechPipeline, PhonemeCache
+from .scheduler import SynthesisScheduler, SynthesisJob, DeadlineExceeded
+from .phonemes import PhonemeError, tokenize, validate_many, estimate_duration
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
@@ -13,5 +17,19 @@ __all__ = [
     "AquesAudio",
     "save_wav", 
     "play_audio", 
-    "audio_to_numpy"
+    "audio_to_numpy",
+    "numpy_to_audio",
+    "PostProcessor",
+    "trim_silence",
+    "normalize_loudness",
+    "apply_fade",
+    "TextToSpeechPipeline",
+    "PhonemeCache",
+    "SynthesisScheduler",
+    "SynthesisJob",
+    "DeadlineExceeded",
+    "PhonemeError",
+    "tokenize",
+    "validate_many",
+    "estimate_duration"
 ]
\ No newline at end of file
@@ -27,6 +27,31 @@ def save_wav(filepath: str, audio: AquesAudio) -> None:
     except Exception as e:
         raise AquesTalkError(f"Failed to save WAV file: {e}")
 
+def _wav_header(data_size: int, sample_rate: int = 8000,
+                bits_per_sample: int = 16, channels: int = 1) -> bytes:
+    """
+    Build a canonical 44-byte PCM WAV header.
+    
+    Args:
+        data_size: Size of the PCM data chunk in bytes. Use 0xFFFFFFFF
+                  for streams of unknown length.
+        sample_rate: Sample rate in Hz
+        bits_per_sample: Bits per sample
+        channels: Number of channels
+    
+    Returns:
+        WAV header bytes
+    """
+    block_align = channels * bits_per_sample // 8
+    riff_size = min(data_size + 36, 0xFFFFFFFF)
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', riff_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, bits_per_sample,
+        b'data', data_size
+    )
+
 def audio_to_numpy(audio: AquesAudio) -> np.ndarray:
     """
     Convert AquesAudio to NumPy array.
@@ -64,6 +89,301 @@ def audio_to_numpy(audio: AquesAudio) -> np.ndarray:
     
     return samples
 
+def numpy_to_audio(samples: np.ndarray, sample_rate: int = 8000) -> AquesAudio:
+    """
+    Convert int16 samples back to AquesAudio with a WAV header.
+    
+    Args:
+        samples: Mono int16 samples
+        sample_rate: Sample rate in Hz
+    
+    Returns:
+        AquesAudio object containing WAV audio data
+    """
+    pcm = np.ascontiguousarray(samples, dtype='<i2').tobytes()
+    return AquesAudio(
+        data=_wav_header(len(pcm), sample_rate) + pcm,
+        sample_rate=sample_rate
+    )
+
+# ----------------------------------------------------------------------
+# Post-processing
+#
+# All stages operate on a contiguous float32 buffer holding one or more
+# clips back to back, described by per-clip start offsets and lengths,
+# so a whole batch is processed with a handful of vectorized operations.
+# ----------------------------------------------------------------------
+
+_FULL_SCALE = 32767.0
+
+def _db_to_amplitude(db: float) -> float:
+    """Convert dBFS to an amplitude in int16 units."""
+    return _FULL_SCALE * 10.0 ** (db / 20.0)
+
+def _level(threshold: float) -> int:
+    """Smallest int16 magnitude at or above an amplitude threshold."""
+    return min(int(np.ceil(threshold)), 32767)
+
+def _starts(lengths: np.ndarray) -> np.ndarray:
+    """Start offset of each clip in a contiguous buffer."""
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return starts
+
+def _positions(lengths: np.ndarray) -> np.ndarray:
+    """Index of every sample within its own clip."""
+    total = int(lengths.sum())
+    return np.arange(total, dtype=np.int64) - np.repeat(_starts(lengths), lengths)
+
+def _trim_bounds(buf: np.ndarray, lengths: np.ndarray, threshold: float,
+                 pad: int) -> tuple:
+    """
+    Find the non-silent span of each clip in an int16 buffer.
+    
+    Returns:
+        (first, end) absolute indices per clip. Clips without any sample
+        above threshold keep their full span.
+    """
+    starts = _starts(lengths)
+    ends = starts + lengths
+    level = _level(threshold)
+    loud = np.flatnonzero((buf >= level) | (buf <= -level))
+    
+    # First loud index at or after each start, last loud index before each end
+    lo = np.searchsorted(loud, starts, side='left')
+    hi = np.searchsorted(loud, ends, side='left') - 1
+    has_sound = lo <= hi
+    
+    first = starts.copy()
+    end = ends.copy()
+    if has_sound.any():
+        first[has_sound] = np.maximum(loud[lo[has_sound]] - pad, starts[has_sound])
+        end[has_sound] = np.minimum(loud[hi[has_sound]] + 1 + pad, ends[has_sound])
+    return first, end
+
+def _gather(buf: np.ndarray, first: np.ndarray, end: np.ndarray) -> tuple:
+    """Copy non-overlapping, ordered spans [first, end) into a new buffer."""
+    # +1 at each span start, -1 at each span end; the running sum is the
+    # keep mask
+    marks = np.zeros(len(buf) + 1, dtype=np.int8)
+    np.add.at(marks, first, 1)
+    np.add.at(marks, end, -1)
+    keep = np.cumsum(marks[:-1], dtype=np.int8).view(np.bool_)
+    return buf[keep], end - first
+
+def _gains(buf: np.ndarray, lengths: np.ndarray, mode: str,
+           target_db: float, threshold: float) -> np.ndarray:
+    """
+    Per-clip gain reaching target_db, limited to avoid clipping.
+    
+    Clips without any sample above threshold are treated as silence and
+    keep a gain of 1.0, so background noise is never raised to target.
+    """
+    gains = np.ones(len(lengths), dtype=np.float32)
+    nonempty = lengths > 0
+    if not nonempty.any():
+        return gains
+    
+    starts = _starts(lengths)[nonempty]
+    peak = np.maximum.reduceat(np.abs(buf), starts)
+    if mode == 'peak':
+        level = peak
+    else:
+        level = np.sqrt(np.add.reduceat(buf * buf, starts) / lengths[nonempty])
+    
+    target = _db_to_amplitude(target_db)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gain = np.where((level > 0) & (peak >= _level(threshold)),
+                        target / level, 1.0)
+        limit = np.where(peak > 0, _FULL_SCALE / peak, 1.0)
+    gains[nonempty] = np.minimum(gain, limit)
+    return gains
+
+def _apply_fades(buf: np.ndarray, lengths: np.ndarray, fade_in: int,
+                 fade_out: int) -> None:
+    """Apply linear fades in place, touching only the faded samples."""
+    starts = _starts(lengths)
+    for fade, at_end in ((fade_in, False), (fade_out, True)):
+        if fade <= 0:
+            continue
+        # Fades never cover more than half of a clip
+        span = np.minimum(fade, lengths // 2)
+        pos = _positions(span)
+        clip_starts = np.repeat(starts + (lengths - span if at_end else 0), span)
+        ramp = (pos + 1).astype(np.float32) / np.repeat(span + 1, span)
+        buf[clip_starts + (span.repeat(span) - 1 - pos if at_end else pos)] *= ramp
+
+def _to_int16(buf: np.ndarray) -> np.ndarray:
+    """Round and saturate a float buffer to int16."""
+    return np.clip(np.rint(buf), -32768, 32767).astype(np.int16)
+
+class PostProcessor:
+    """
+    Silence trimming, loudness normalization and fades for synthesized audio.
+    
+    Stages run in that order and each can be disabled. A clip with no
+    sample above threshold_db counts as silence: trimming keeps it as is
+    and normalization leaves its level unchanged, rather than raising
+    background noise to full scale. An instance is
+    callable on a single AquesAudio, so it can be chained into synthesis:
+    
+        post = PostProcessor(normalize='rms', target_db=-20.0)
+        audio = synth.synthesize("こんにちわ。", postprocess=post)
+    
+    Use process_batch() to handle many clips in one pass.
+    """
+    
+    def __init__(self, trim: bool = True, threshold_db: float = -40.0,
+                 pad_ms: float = 10.0, normalize: Optional[str] = 'peak',
+                 target_db: float = -1.0, fade_in_ms: float = 5.0,
+                 fade_out_ms: float = 5.0):
+        """
+        Initialize the post-processor.
+        
+        Args:
+            trim: Remove leading and trailing silence
+            threshold_db: Level (dBFS) below which samples count as silence
+            pad_ms: Silence kept before and after the trimmed span
+            normalize: 'peak', 'rms' or None to keep the original level.
+                      Silent clips are never amplified.
+            target_db: Target peak or RMS level in dBFS
+            fade_in_ms: Fade-in length (0 disables)
+            fade_out_ms: Fade-out length (0 disables)
+        
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if normalize not in (None, 'peak', 'rms'):
+            raise ValueError(f"Unsupported normalization: {normalize}")
+        if target_db > 0:
+            raise ValueError("target_db must not exceed 0 dBFS")
+        if pad_ms < 0 or fade_in_ms < 0 or fade_out_ms < 0:
+            raise ValueError("Durations cannot be negative")
+        
+        self.trim = trim
+        self.threshold_db = threshold_db
+        self.pad_ms = pad_ms
+        self.normalize = normalize
+        self.target_db = target_db
+        self.fade_in_ms = fade_in_ms
+        self.fade_out_ms = fade_out_ms
+    
+    def process_arrays(self, clips, sample_rate: int = 8000) -> list:
+        """
+        Process int16 sample arrays in one pass over a contiguous buffer.
+        
+        Args:
+            clips: Sequence of 1-D int16 arrays
+            sample_rate: Sample rate in Hz
+        
+        Returns:
+            List of processed int16 arrays, in input order
+        """
+        if len(clips) == 0:
+            return []
+        
+        lengths = np.array([len(c) for c in clips], dtype=np.int64)
+        buf = np.concatenate(clips).astype(np.int16, copy=False)
+        ms = sample_rate / 1000.0
+        
+        if self.trim:
+            first, end = _trim_bounds(buf, lengths,
+                                      _db_to_amplitude(self.threshold_db),
+                                      int(self.pad_ms * ms))
+            buf, lengths = _gather(buf, first, end)
+        
+        buf = buf.astype(np.float32)
+        if self.normalize:
+            gains = _gains(buf, lengths, self.normalize, self.target_db,
+                           _db_to_amplitude(self.threshold_db))
+            buf *= np.repeat(gains, lengths)
+        
+        _apply_fades(buf, lengths, int(self.fade_in_ms * ms),
+                     int(self.fade_out_ms * ms))
+        
+        return np.split(_to_int16(buf), _starts(lengths)[1:])
+    
+    def process_batch(self, clips) -> list:
+        """
+        Process many AquesAudio clips in one pass.
+        
+        Args:
+            clips: Sequence of AquesAudio objects with the same sample rate
+        
+        Returns:
+            List of processed AquesAudio objects, in input order
+        """
+        if len(clips) == 0:
+            return []
+        sample_rate = clips[0].sample_rate
+        if any(c.sample_rate != sample_rate for c in clips):
+            raise AquesTalkError("Cannot batch clips with different sample rates")
+        
+        arrays = self.process_arrays([audio_to_numpy(c) for c in clips], sample_rate)
+        return [numpy_to_audio(a, sample_rate) for a in arrays]
+    
+    def __call__(self, audio: AquesAudio) -> AquesAudio:
+        """Process a single clip."""
+        return self.process_batch([audio])[0]
+
+def trim_silence(samples: np.ndarray, threshold_db: float = -40.0,
+                 pad_ms: float = 10.0, sample_rate: int = 8000) -> np.ndarray:
+    """
+    Remove leading and trailing silence from int16 samples.
+    
+    Args:
+        samples: Mono int16 samples
+        threshold_db: Level (dBFS) below which samples count as silence
+        pad_ms: Silence kept before and after the trimmed span
+        sample_rate: Sample rate in Hz
+    
+    Returns:
+        Trimmed int16 samples
+    """
+    post = PostProcessor(threshold_db=threshold_db, pad_ms=pad_ms,
+                         normalize=None, fade_in_ms=0, fade_out_ms=0)
+    return post.process_arrays([samples], sample_rate)[0]
+
+def normalize_loudness(samples: np.ndarray, target_db: float = -1.0,
+                       mode: str = 'peak',
+                       threshold_db: float = -40.0) -> np.ndarray:
+    """
+    Scale int16 samples so their peak or RMS level reaches target_db.
+    
+    Gain is limited so that the result never clips. Samples with no value
+    above threshold_db are returned unchanged.
+    
+    Args:
+        samples: Mono int16 samples
+        target_db: Target level in dBFS
+        mode: 'peak' or 'rms'
+        threshold_db: Level (dBFS) below which samples count as silence
+    
+    Returns:
+        Normalized int16 samples
+    """
+    post = PostProcessor(trim=False, threshold_db=threshold_db, normalize=mode,
+                         target_db=target_db, fade_in_ms=0, fade_out_ms=0)
+    return post.process_arrays([samples])[0]
+
+def apply_fade(samples: np.ndarray, fade_in_ms: float = 5.0,
+               fade_out_ms: float = 5.0, sample_rate: int = 8000) -> np.ndarray:
+    """
+    Apply linear fade-in and fade-out to int16 samples.
+    
+    Args:
+        samples: Mono int16 samples
+        fade_in_ms: Fade-in length
+        fade_out_ms: Fade-out length
+        sample_rate: Sample rate in Hz
+    
+    Returns:
+        Faded int16 samples
+    """
+    post = PostProcessor(trim=False, normalize=None, fade_in_ms=fade_in_ms,
+                         fade_out_ms=fade_out_ms)
+    return post.process_arrays([samples], sample_rate)[0]
+
 def play_audio(audio: AquesAudio, block: bool = True) -> bool:
     """
     Play AquesAudio using available audio backend.
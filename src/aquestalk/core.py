@@ -5,7 +5,7 @@ Core implementation of AquesTalk speech synthesis wrapper.
 import ctypes
 import os
 import sys
-from typing import Optional, Tuple, Union
+from typing import Callable, Optional, Tuple, Union
 from dataclasses import dataclass
 
 @dataclass
@@ -184,7 +184,9 @@ class AquesTalk:
             raise ValueError(f"Unsupported encoding: {encoding}")
     
     def synthesize(self, phonemes: str, encoding: str = 'utf-8', 
-                   speed: int = DEFAULT_SPEED) -> AquesAudio:
+                   speed: int = DEFAULT_SPEED,
+                   postprocess: Optional[Callable[[AquesAudio], AquesAudio]] = None,
+                   validate: bool = False) -> AquesAudio:
         """
         Synthesize phoneme string to speech audio.
         
@@ -192,12 +194,16 @@ class AquesTalk:
             phonemes: Phoneme string to synthesize
             encoding: Encoding of phoneme string ('utf-8', 'utf-16', or 'sjis')
             speed: Speech speed in percent (50-300, default 100)
+            postprocess: Optional callable applied to the result,
+                        e.g. an aquestalk.audio.PostProcessor
+            validate: Check the phoneme string before the native call
         
         Returns:
             AquesAudio object containing WAV audio data
         
         Raises:
             AquesTalkError: If synthesis fails
+            PhonemeError: If validate is True and the string is malformed
             ValueError: If parameters are invalid
         """
         if not self._is_initialized:
@@ -206,6 +212,10 @@ class AquesTalk:
         if not phonemes:
             raise ValueError("Phoneme string cannot be empty")
         
+        if validate:
+            from .phonemes import check
+            check(phonemes)
+        
         # Validate and adjust speed
         speed = self._validate_speed(speed)
         
@@ -261,12 +271,14 @@ class AquesTalk:
                 channels=self.CHANNELS
             )
             
-            return audio
-            
         finally:
             # Always free the memory allocated by C library
             if audio_ptr:
                 self._lib.AquesTalk_FreeWave(audio_ptr)
+        
+        if postprocess is not None:
+            audio = postprocess(audio)
+        return audio
     
     def synthesize_to_file(self, phonemes: str, output_path: str, 
                           encoding: str = 'utf-8', speed: int = DEFAULT_SPEED) -> bool:
@@ -0,0 +1,472 @@
+"""
+Lexer and validator for AquesTalk phoneme strings.
+
+Implements the symbol specification in ``siyo_onseikigou.pdf`` (v2.0):
+reading symbols (morae), accent marks, delimiters and tags. Input is
+checked before it reaches the native engine, with the position of each
+problem reported.
+
+Only kana notation is understood. ASCII Roman notation, which section 2
+of the specification still mentions, is reported as an error, so do not
+validate strings written in it.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .core import AquesTalk, AquesTalkError
+
+# Token kinds
+MORA = 'mora'
+ACCENT = 'accent'
+DELIMITER = 'delimiter'
+TAG = 'tag'
+INVALID = 'invalid'
+
+# Reading symbol table (section 5), written in hiragana. Katakana forms
+# are derived below.
+_READINGS = """
+あ い う え お
+か き く け こ くぁ くぃ くぇ くぉ
+さ し す せ そ すぃ てゅ
+た ち つ て と てぃ とぅ
+な に ぬ ね の
+は ひ ふ へ ほ ふぁ ふぃ ふゅ ふぇ ふぉ
+ま み む め も
+や ゆ いぇ よ つぁ つぃ つぇ つぉ
+ら り る れ ろ
+わ うぃ うぇ うぉ を
+が ぎ ぐ げ ご ぐぁ ぐぃ ぐぇ ぐぉ
+ざ じ ず ぜ ぞ ずぃ でゅ
+だ で ど でぃ どぅ
+ば び ぶ べ ぼ
+ぱ ぴ ぷ ぺ ぽ
+きゃ きゅ きぇ きょ
+しゃ しゅ しぇ しょ
+ちゃ ちゅ ちぇ ちょ
+にゃ にゅ にぇ にょ
+ひゃ ひゅ ひぇ ひょ
+みゃ みゅ みぇ みょ
+りゃ りゅ りぇ りょ
+ぎゃ ぎゅ ぎぇ ぎょ
+じゃ じゅ じぇ じょ
+びゃ びゅ びぇ びょ
+ぴゃ ぴゅ ぴぇ ぴょ
+ん っ ー
+""".split()
+
+# Forced devoicing (section 2.6) and forced nasal ga-row (section 2.7)
+_DEVOICED = """
+_キ _ク _スィ _ス _ティ _トゥ _ヒ _フ _ピ
+_プ _シ _シュ _チ _チュ _ツィ _ツ _フィ
+""".split()
+_NASAL = [base + mark
+          for base in ('カ', 'キ', 'ク', 'ケ', 'コ')
+          for mark in ('゜', '゚')]
+_NASAL += [base + mark + small
+           for base in ('キ',)
+           for mark in ('゜', '゚')
+           for small in ('ャ', 'ュ', 'ェ', 'ョ')]
+
+# Symbols that may not follow a devoiced symbol (section 3.8, rule 5)
+_AFTER_DEVOICED = """
+ー あ い う え お ん や ゆ いぇ よ わ を だ で ど ば び ぶ べ ぼ うぃ うぇ うぉ
+びゃ びゅ びぇ びょ でぃ どぅ でゅ
+""".split()
+
+# Delimiters (section 3.5) and the pause each one inserts
+PAUSES = {
+    '。': 'sentence',
+    '？': 'sentence',
+    '、': 'long',
+    ',': 'short',
+    ';': 'none',
+    '/': 'none',
+    '+': 'none',
+}
+SENTENCE_ENDS = frozenset(d for d, pause in PAUSES.items() if pause == 'sentence')
+
+# Maximum size of the text between "<" and ">" in bytes (section 3.6)
+MAX_TAG_BYTES = 255
+
+
+def _to_katakana(text: str) -> str:
+    return ''.join(chr(ord(c) + 0x60) if 'ぁ' <= c <= 'ゖ' else c for c in text)
+
+
+_MORAE = frozenset(_READINGS) | frozenset(_to_katakana(r) for r in _READINGS) \
+    | frozenset(_DEVOICED) | frozenset(_NASAL)
+_SOKUON = frozenset(('っ', 'ッ'))
+_FORBIDDEN_AFTER_DEVOICED = frozenset(_AFTER_DEVOICED) \
+    | frozenset(_to_katakana(s) for s in _AFTER_DEVOICED) \
+    | frozenset('ガ ギ グ ゲ ゴ ギャ ギュ ギェ ギョ'.split())
+
+
+def _trie_pattern(symbols) -> str:
+    """
+    Compile a set of symbols into a prefix-tree shaped regex.
+
+    Branches start with distinct characters and optional suffixes are
+    greedy, so the longest symbol wins ("きゃ" over "き") without the
+    backtracking of a flat alternation.
+    """
+    trie = {}
+    for symbol in symbols:
+        node = trie
+        for char in symbol:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        leaves = []
+        branches = []
+        for char in sorted(c for c in node if c):
+            sub = build(node[char])
+            if sub:
+                branches.append(re.escape(char) + sub)
+            else:
+                leaves.append(re.escape(char))
+        if len(leaves) > 1:
+            branches.append('[' + ''.join(leaves) + ']')
+        else:
+            branches.extend(leaves)
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+# Single-pass scanner; group order decides the token kind
+_SCANNER = re.compile(
+    r"(?P<tag><(?:\"[^\"]*\"|[^<>\"])*>)"
+    r"|(?P<mora>" + _trie_pattern(_MORAE) + r")"
+    r"|(?P<accent>')"
+    r"|(?P<delimiter>[" + re.escape(''.join(PAUSES)) + r"])"
+    r"|(?P<invalid>.)",
+    re.DOTALL)
+
+_TAG_NUM = re.compile(r'NUM VAL=[0-9.\-]+\Z')
+_TAG_NUMK = re.compile(r'NUMK VAL=([0-9]+)(?:\.[0-9]+)?(?: COUNTER=(\S+))?\Z')
+_TAG_ALPHA = re.compile(
+    r'ALPHA VAL=(?:"[\x20-\x21\x23-\x7e¥]*"|[0-9A-Za-z!#$%&*+,\-./:;?@¥^_]+)\Z')
+
+
+class Token(NamedTuple):
+    """A lexical unit of a phoneme string."""
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+class Diagnostic(NamedTuple):
+    """A problem found in a phoneme string."""
+    position: int
+    length: int
+    message: str
+    severity: str = 'error'
+
+    def __str__(self) -> str:
+        return f"{self.severity} at {self.position}: {self.message}"
+
+
+class PhonemeError(AquesTalkError):
+    """Raised when a phoneme string fails validation."""
+    def __init__(self, phonemes: str, diagnostics: List[Diagnostic]):
+        self.phonemes = phonemes
+        self.diagnostics = diagnostics
+        first = diagnostics[0]
+        super().__init__(f"Invalid phoneme string at position {first.position}: "
+                         f"{first.message}")
+
+    @property
+    def position(self) -> int:
+        """Position of the first error."""
+        return self.diagnostics[0].position
+
+
+def tokenize(phonemes: str) -> List[Token]:
+    """
+    Split a phoneme string into tokens.
+
+    Never raises; characters that are not valid symbols become INVALID
+    tokens (see validate() for diagnostics).
+
+    Args:
+        phonemes: Phoneme string
+
+    Returns:
+        List of tokens in input order
+    """
+    return [Token(m.lastgroup, m.group(), m.start(), m.end())
+            for m in _SCANNER.finditer(phonemes)]
+
+
+def _check_tag(token: Token) -> Optional[str]:
+    """Return an error message for a malformed tag, or None."""
+    body = token.text[1:-1]
+    if len(body.encode('utf-8')) > MAX_TAG_BYTES:
+        return f"Tag exceeds {MAX_TAG_BYTES} bytes"
+    if body.startswith('NUM '):
+        if not _TAG_NUM.match(body):
+            return "NUM tag value must consist of 0-9, '-' and '.'"
+    elif body.startswith('NUMK '):
+        match = _TAG_NUMK.match(body)
+        if not match:
+            return "NUMK tag value must be a number with an optional decimal part"
+        if len(match.group(1)) > 16:
+            return "NUMK tag value exceeds 9999999999999999"
+        counter = match.group(2)
+        if counter and any(t.kind not in (MORA, ACCENT) for t in tokenize(counter)):
+            return "NUMK tag COUNTER must consist of reading symbols"
+    elif body.startswith('ALPHA '):
+        if not _TAG_ALPHA.match(body):
+            return "ALPHA tag value contains unsupported characters"
+    else:
+        return f"Unknown tag: <{body.split(' ', 1)[0]}>"
+    return None
+
+
+def _invalid_message(char: str) -> str:
+    if char == '<':
+        return "Unterminated tag"
+    if char == '_':
+        return "Devoicing '_' must precede a symbol from the devoicing table"
+    if char in ('ぢ', 'づ', 'ヂ', 'ヅ'):
+        return f"Undefined reading symbol '{char}' (use じ/ず instead)"
+    if char == '?':
+        return "Half-width '?' is not a delimiter (use full-width '？')"
+    if char == '-':
+        return "Hyphen is not a long vowel (use 'ー')"
+    if char.isspace():
+        return f"Invalid character {char!r}"
+    if char.isascii() and char.isalpha():
+        return "Roman phoneme notation is not supported by this validator (use kana)"
+    return f"Undefined reading symbol {char!r}"
+
+
+def validate_tokens(tokens: List[Token]) -> List[Diagnostic]:
+    """
+    Check a token stream against the phoneme string grammar.
+
+    Args:
+        tokens: Output of tokenize()
+
+    Returns:
+        List of diagnostics (empty if the string is valid)
+    """
+    diagnostics = []
+    prev = None
+    phrase_accent = False
+
+    for token in tokens:
+        kind = token.kind
+        text = token.text
+
+        if kind == MORA:
+            if text == 'ー':
+                if prev is None or prev.kind == DELIMITER:
+                    diagnostics.append(Diagnostic(token.start, 1,
+                        "Long vowel 'ー' cannot start an accent phrase"))
+                elif prev.kind == MORA and prev.text in _SOKUON:
+                    diagnostics.append(Diagnostic(token.start, 1,
+                        "Long vowel 'ー' cannot follow a geminate consonant"))
+            if text in _SOKUON and prev is not None and prev.kind == MORA \
+                    and prev.text in _SOKUON:
+                diagnostics.append(Diagnostic(token.start, 1,
+                    "Consecutive geminate consonants"))
+            if prev is not None and prev.kind == MORA and prev.text[0] == '_' \
+                    and text in _FORBIDDEN_AFTER_DEVOICED:
+                diagnostics.append(Diagnostic(token.start, len(text),
+                    f"'{text}' cannot follow devoiced '{prev.text}'"))
+
+        elif kind == ACCENT:
+            if prev is not None and prev.kind == INVALID:
+                pass
+            elif prev is None or prev.kind != MORA:
+                diagnostics.append(Diagnostic(token.start, 1,
+                    "Accent mark must follow a reading symbol"))
+            elif phrase_accent:
+                diagnostics.append(Diagnostic(token.start, 1,
+                    "Only one accent mark is allowed per accent phrase"))
+            phrase_accent = True
+
+        elif kind == DELIMITER:
+            phrase_accent = False
+
+        elif kind == TAG:
+            message = _check_tag(token)
+            if message:
+                diagnostics.append(Diagnostic(token.start, len(text), message))
+            # A tag is expanded as a sentence of its own
+            phrase_accent = False
+
+        else:
+            message = _invalid_message(text)
+            last = diagnostics[-1] if diagnostics else None
+            if last is not None and prev.kind == INVALID and last.message == message \
+                    and last.position + last.length == token.start:
+                # Report a run of the same problem once
+                diagnostics[-1] = last._replace(length=last.length + 1)
+            else:
+                diagnostics.append(Diagnostic(token.start, 1, message))
+            if text == '<':
+                # The rest of the string cannot be lexed reliably
+                return diagnostics
+
+        prev = token
+
+    if not tokens:
+        diagnostics.append(Diagnostic(0, 0, "Phoneme string is empty"))
+    elif prev is not None and prev.kind not in (DELIMITER, TAG, INVALID):
+        diagnostics.append(Diagnostic(prev.end, 0,
+            "Phoneme string should end with a delimiter", 'warning'))
+    return diagnostics
+
+
+def validate(phonemes: str, warnings: bool = False) -> List[Diagnostic]:
+    """
+    Validate a phoneme string.
+
+    Args:
+        phonemes: Phoneme string
+        warnings: Include warnings as well as errors
+
+    Returns:
+        List of diagnostics (empty if the string is valid)
+    """
+    diagnostics = validate_tokens(tokenize(phonemes))
+    if not warnings:
+        diagnostics = [d for d in diagnostics if d.severity == 'error']
+    return diagnostics
+
+
+def is_valid(phonemes: str) -> bool:
+    """Return True if the phoneme string has no errors."""
+    return not validate(phonemes)
+
+
+def check(phonemes: str) -> List[Token]:
+    """
+    Validate a phoneme string and return its tokens.
+
+    Raises:
+        PhonemeError: If the string has errors
+    """
+    tokens = tokenize(phonemes)
+    errors = [d for d in validate_tokens(tokens) if d.severity == 'error']
+    if errors:
+        raise PhonemeError(phonemes, errors)
+    return tokens
+
+
+def validate_many(strings: Iterable[str]) -> List[List[Diagnostic]]:
+    """
+    Validate many phoneme strings.
+
+    Repeated strings are only validated once.
+
+    Example:
+        results = validate_many(rows)
+        good = [row for row, errors in zip(rows, results) if not errors]
+
+    Args:
+        strings: Phoneme strings
+
+    Returns:
+        List of error diagnostics per string, in input order
+    """
+    seen: Dict[str, List[Diagnostic]] = {}
+    results = []
+    for phonemes in strings:
+        diagnostics = seen.get(phonemes)
+        if diagnostics is None:
+            diagnostics = seen[phonemes] = validate(phonemes)
+        results.append(diagnostics)
+    return results
+
+
+def split(phonemes: Union[str, List[Token]],
+          delimiters: Iterable[str] = SENTENCE_ENDS) -> List[str]:
+    """
+    Split a phoneme string after each of the given delimiters.
+
+    Each part keeps its delimiter. Delimiters following a split point
+    (section 3.7 allows runs of them) stay with the phrase before it, and
+    leading delimiters with the first phrase, so no part consists of
+    delimiters alone and every part of a valid string is valid on its
+    own. Delimiters inside tags are never split on.
+
+    Args:
+        phonemes: Phoneme string or its tokens
+        delimiters: Delimiters to split after (default: sentence ends)
+
+    Returns:
+        List of non-empty parts
+    """
+    tokens = tokenize(phonemes) if isinstance(phonemes, str) else phonemes
+    delimiters = frozenset(delimiters)
+    parts = []
+    current = []
+    content = False
+    for token in tokens:
+        if token.kind == DELIMITER and not content and parts:
+            # Delimiters right after a split point stay with that phrase
+            parts[-1] += token.text
+            continue
+        current.append(token.text)
+        if token.kind != DELIMITER:
+            content = True
+        elif content and token.text in delimiters:
+            parts.append(''.join(current))
+            current = []
+            content = False
+    if current:
+        parts.append(''.join(current))
+    return parts
+
+
+# Rough timing model for duration estimates at speed 100
+_MORA_SECONDS = 0.12
+_PAUSE_SECONDS = {'sentence': 0.5, 'long': 0.3, 'short': 0.15, 'none': 0.0}
+_TAG_MORAE_PER_CHAR = 2
+
+
+def count_morae(phonemes: Union[str, List[Token]]) -> int:
+    """
+    Count morae in a phoneme string.
+
+    Tags are approximated by their value length.
+    """
+    tokens = tokenize(phonemes) if isinstance(phonemes, str) else phonemes
+    morae = 0
+    for token in tokens:
+        if token.kind == MORA:
+            morae += 1
+        elif token.kind == TAG:
+            value = token.text[1:-1].partition('VAL=')[2].split(' ', 1)[0]
+            morae += len(value.strip('"')) * _TAG_MORAE_PER_CHAR
+    return morae
+
+
+def estimate_duration(phonemes: Union[str, List[Token]],
+                      speed: int = AquesTalk.DEFAULT_SPEED) -> float:
+    """
+    Estimate the spoken duration of a phoneme string without synthesis.
+
+    Args:
+        phonemes: Phoneme string or its tokens
+        speed: Speech speed in percent
+
+    Returns:
+        Approximate duration in seconds
+    """
+    tokens = tokenize(phonemes) if isinstance(phonemes, str) else phonemes
+    seconds = count_morae(tokens) * _MORA_SECONDS
+    seconds += sum(_PAUSE_SECONDS[PAUSES[t.text]] for t in tokens
+                   if t.kind == DELIMITER)
+    return seconds * AquesTalk.DEFAULT_SPEED / speed
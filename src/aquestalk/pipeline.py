@@ -0,0 +1,252 @@
+"""
+Text-to-speech pipeline combining a text frontend with AquesTalk.
+"""
+
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from .core import AquesTalk, AquesAudio, AquesTalkError
+
+# Sentinel marking the end of the conversion stream
+_END = object()
+
+
+class PhonemeCache:
+    """
+    Bounded LRU cache for text → phoneme conversion results.
+
+    Thread-safe; shared between the conversion thread and callers.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Maximum number of entries to keep (0 disables caching)
+        """
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> Optional[str]:
+        """Return cached phonemes for text, or None if not cached."""
+        with self._lock:
+            phonemes = self._data.get(text)
+            if phonemes is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(text)
+            self.hits += 1
+            return phonemes
+
+    def put(self, text: str, phonemes: str) -> None:
+        """Store phonemes for text, evicting the least recently used entry."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[text] = phonemes
+            self._data.move_to_end(text)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TextToSpeechPipeline:
+    """
+    Pipelined text-to-speech: text frontend → phonemes → AquesTalk.
+
+    Conversion of the next sentence runs in a background thread while
+    the current one is being synthesized. Converted phonemes are passed
+    through a bounded queue, so the frontend never runs far ahead of
+    synthesis. Results are yielded in input order.
+
+    Example:
+        k2k = AqKanji2Koe(dict_dir, dll_path)
+        synth = AquesTalk(dll_path)
+        pipeline = TextToSpeechPipeline(k2k, synth)
+        for audio in pipeline.run(["こんにちは", "ゆっくりしていってね"]):
+            play_audio(audio)
+    """
+
+    # Seconds run() waits for the conversion thread when it finishes
+    JOIN_TIMEOUT = 1.0
+
+    def __init__(self, frontend: Union[Callable[[str], str], object],
+                 synthesizer: AquesTalk, speed: int = AquesTalk.DEFAULT_SPEED,
+                 cache_size: int = 1024, queue_size: int = 2,
+                 frontend_encoding: str = 'utf-8',
+                 postprocess: Optional[Callable[[AquesAudio], AquesAudio]] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            frontend: Text → phoneme converter. Either an object with a
+                     ``convert(text, encoding=...)`` method (AqKanji2Koe)
+                     or any callable taking text and returning phonemes.
+            synthesizer: AquesTalk instance used for synthesis
+            speed: Speech speed in percent (50-300, default 100)
+            cache_size: Maximum number of memoized conversions (0 disables)
+            queue_size: Maximum number of converted sentences waiting
+                       for synthesis
+            frontend_encoding: Encoding passed to ``convert()``
+            postprocess: Optional callable applied to each clip,
+                        e.g. an aquestalk.audio.PostProcessor
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if hasattr(frontend, 'convert'):
+            convert = frontend.convert
+            self._convert = lambda text: convert(text, encoding=frontend_encoding)
+        elif callable(frontend):
+            self._convert = frontend
+        else:
+            raise ValueError("Frontend must be callable or provide convert()")
+
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least 1")
+
+        self.synthesizer = synthesizer
+        self.speed = speed
+        self.queue_size = queue_size
+        self.postprocess = postprocess
+        self.cache = PhonemeCache(cache_size)
+
+    def to_phonemes(self, text: str) -> str:
+        """
+        Convert text to phonemes, using the cache when possible.
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            Phoneme string
+
+        Raises:
+            AquesTalkError: If the frontend returns no phonemes
+        """
+        phonemes = self.cache.get(text)
+        if phonemes is None:
+            phonemes = self._convert(text)
+            if not phonemes:
+                raise AquesTalkError(f"Text conversion returned no phonemes: {text!r}")
+            self.cache.put(text, phonemes)
+        return phonemes
+
+    def _produce(self, texts: Iterable[str], out: queue.Queue,
+                 stop: threading.Event) -> None:
+        """Conversion thread: push (phonemes, error, fatal) items onto the queue."""
+        try:
+            for text in texts:
+                # The consumer may have left while we waited on the input
+                if stop.is_set():
+                    return
+                try:
+                    item = (self.to_phonemes(text), None, False)
+                except Exception as e:
+                    item = (None, e, False)
+                if not self._put(out, item, stop):
+                    return
+        except Exception as e:
+            # Failure in the input iterable itself ends the stream
+            self._put(out, (None, e, True), stop)
+        self._put(out, _END, stop)
+
+    @staticmethod
+    def _put(out: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put item on the queue, giving up if the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(self, texts: Iterable[str],
+            return_exceptions: bool = False) -> Iterator[Union[AquesAudio, Exception]]:
+        """
+        Synthesize texts, yielding audio in input order.
+
+        If the consumer stops early while the input iterable is blocked
+        (e.g. a generator waiting for the next chat message), the
+        conversion thread is not waited for beyond JOIN_TIMEOUT. It is a
+        daemon thread and exits once the iterable yields or ends, without
+        converting further items.
+
+        Args:
+            texts: Iterable of sentences (may be a lazy generator)
+            return_exceptions: If True, a sentence whose conversion or
+                              synthesis fails yields its exception and
+                              the remaining sentences are still processed
+
+        Yields:
+            AquesAudio for each sentence (or the exception for failed
+            sentences when return_exceptions is True)
+
+        Raises:
+            AquesTalkError: If conversion or synthesis of a sentence fails
+                           and return_exceptions is False. Sentences before
+                           it have already been yielded.
+        """
+        out = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._produce, args=(texts, out, stop),
+                                  name="aquestalk-frontend", daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                item = out.get()
+                if item is _END:
+                    break
+                phonemes, error, fatal = item
+                if error is None:
+                    try:
+                        audio = self._synthesize(phonemes)
+                    except Exception as e:
+                        error = e
+                if error is None:
+                    yield audio
+                elif return_exceptions and not fatal:
+                    yield error
+                else:
+                    raise error
+        finally:
+            # Also reached when the consumer closes the generator early.
+            # Bounded, since the producer may be blocked in the input.
+            stop.set()
+            worker.join(self.JOIN_TIMEOUT)
+
+    def _synthesize(self, phonemes: str) -> AquesAudio:
+        """Synthesize phonemes and apply post-processing."""
+        audio = self.synthesizer.synthesize(phonemes, speed=self.speed)
+        if self.postprocess is not None:
+            audio = self.postprocess(audio)
+        return audio
+
+    def synthesize(self, text: str) -> AquesAudio:
+        """
+        Synthesize a single sentence without spawning a thread.
+
+        Args:
+            text: Sentence to synthesize
+
+        Returns:
+            AquesAudio object containing WAV audio data
+        """
+        return self._synthesize(self.to_phonemes(text))
@@ -0,0 +1,410 @@
+"""
+Priority and deadline-aware scheduling of synthesis requests.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence, Union
+
+from .core import AquesTalk, AquesAudio, AquesTalkError
+
+
+class DeadlineExceeded(AquesTalkError):
+    """Raised when a request cannot be served before its deadline."""
+    def __init__(self, message: str = "Deadline exceeded"):
+        super().__init__(message, -1)
+
+
+class SynthesisJob:
+    """
+    Handle for a scheduled synthesis request.
+
+    Queue wait and service time are recorded separately once the job
+    has run.
+    """
+
+    def __init__(self, phonemes: str, voice: str, speed: int, priority: int,
+                 tenant: str, deadline: Optional[float]):
+        self.phonemes = phonemes
+        self.voice = voice
+        self.speed = speed
+        self.priority = priority
+        self.tenant = tenant
+        self.deadline = deadline
+        self.degraded = False
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.future = Future()
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """Seconds spent waiting in the queue (None until started)."""
+        if self.started is None:
+            return None
+        return self.started - self.submitted
+
+    @property
+    def service_time(self) -> Optional[float]:
+        """Seconds spent in the native call (None until finished)."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+    def result(self, timeout: Optional[float] = None) -> AquesAudio:
+        """
+        Wait for the synthesized audio.
+
+        Raises:
+            DeadlineExceeded: If the job was dropped
+            AquesTalkError: If synthesis fails
+        """
+        return self.future.result(timeout)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+
+class _ClassStats:
+    """Rolling statistics for one priority class."""
+
+    def __init__(self, window: int):
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.degraded = 0
+        self.queue_wait = deque(maxlen=window)
+        self.service_time = deque(maxlen=window)
+
+    @staticmethod
+    def _percentiles(samples) -> dict:
+        if not samples:
+            return {'p50': None, 'p99': None, 'max': None}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            'p50': ordered[int(last * 0.50)],
+            'p99': ordered[int(last * 0.99)],
+            'max': ordered[last],
+        }
+
+    def snapshot(self) -> dict:
+        return {
+            'completed': self.completed,
+            'failed': self.failed,
+            'dropped': self.dropped,
+            'degraded': self.degraded,
+            'queue_wait': self._percentiles(self.queue_wait),
+            'service_time': self._percentiles(self.service_time),
+        }
+
+
+class SynthesisScheduler:
+    """
+    Scheduler placed in front of one or more synthesis engines.
+
+    - Priority classes: a waiting request of a higher class (lower
+      number) is always dispatched before one of a lower class; lower
+      classes use whatever capacity is left.
+    - Fair sharing: within a class, tenants are served round-robin, so
+      one tenant's large batch cannot monopolize the class.
+    - Deadlines: a request whose deadline has passed, or that is
+      predicted to miss it, is dropped with DeadlineExceeded or, with
+      ``on_late='degrade'``, synthesized at a higher speed if that fits.
+    - Concurrency cap: each engine runs at most ``max_inflight`` native
+      calls at a time.
+
+    Example:
+        scheduler = SynthesisScheduler({'f1': AquesTalk(path)})
+        job = scheduler.submit("こんにちわ。", priority=scheduler.INTERACTIVE,
+                               deadline=0.5)
+        audio = job.result()
+        scheduler.shutdown()
+    """
+
+    # Priority classes
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+    _CLASS_NAMES = {INTERACTIVE: 'interactive', NORMAL: 'normal', BATCH: 'batch'}
+
+    # EWMA weight for service time estimates
+    _EWMA_ALPHA = 0.2
+
+    def __init__(self, engines: Dict[str, Union[object, Sequence[object]]],
+                 max_inflight: int = 1, on_late: str = 'drop',
+                 degrade_factor: float = 1.5, stats_window: int = 1024):
+        """
+        Initialize the scheduler and start its worker threads.
+
+        Args:
+            engines: Mapping of voice name to an engine or list of engines.
+                    Engines must provide ``synthesize(phonemes, encoding, speed)``.
+            max_inflight: Maximum concurrent native calls per engine
+            on_late: 'drop' or 'degrade' for requests that cannot make
+                    their deadline
+            degrade_factor: Speed multiplier applied when degrading
+            stats_window: Number of recent samples kept per class
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if not engines:
+            raise ValueError("At least one voice is required")
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
+        if on_late not in ('drop', 'degrade'):
+            raise ValueError(f"Unsupported on_late policy: {on_late}")
+
+        self.on_late = on_late
+        self.degrade_factor = degrade_factor
+
+        # voice -> priority -> tenant -> deque of jobs (tenant order is
+        # the round-robin order)
+        self._queues = {}
+        # voice -> estimated seconds per phoneme character at speed 100
+        self._rate = {}
+        self._stats = {p: _ClassStats(stats_window) for p in self._CLASS_NAMES}
+        self._lock = threading.Lock()
+        # One condition per voice, so a submit wakes a worker that can
+        # actually serve it
+        self._conds = {}
+        self._closed = False
+        self._workers = []
+
+        for voice, instances in engines.items():
+            if not isinstance(instances, (list, tuple)):
+                instances = [instances]
+            if not instances:
+                raise ValueError(f"No engines for voice: {voice}")
+            self._queues[voice] = {p: OrderedDict() for p in self._CLASS_NAMES}
+            self._conds[voice] = threading.Condition(self._lock)
+            self._rate[voice] = None
+            for n, engine in enumerate(instances):
+                for slot in range(max_inflight):
+                    worker = threading.Thread(
+                        target=self._work, args=(voice, engine),
+                        name=f"aquestalk-{voice}-{n}.{slot}", daemon=True)
+                    worker.start()
+                    self._workers.append(worker)
+
+    @property
+    def voices(self) -> List[str]:
+        """Names of available voices."""
+        return sorted(self._queues)
+
+    def submit(self, phonemes: str, voice: Optional[str] = None,
+               speed: int = AquesTalk.DEFAULT_SPEED, priority: int = NORMAL,
+               tenant: str = '', deadline: Optional[float] = None) -> SynthesisJob:
+        """
+        Queue a synthesis request.
+
+        Args:
+            phonemes: Phoneme string to synthesize
+            voice: Voice name (default: first voice)
+            speed: Speech speed in percent (50-300)
+            priority: INTERACTIVE, NORMAL or BATCH
+            tenant: Key used for fair sharing within a priority class
+            deadline: Seconds from now by which synthesis must finish
+
+        Returns:
+            SynthesisJob handle
+
+        Raises:
+            ValueError: If parameters are invalid
+            AquesTalkError: If the scheduler is shut down
+        """
+        if not phonemes:
+            raise ValueError("Phoneme string cannot be empty")
+        if voice is None:
+            voice = self.voices[0]
+        if voice not in self._queues:
+            raise ValueError(f"Unknown voice: {voice}")
+        if priority not in self._CLASS_NAMES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        if not AquesTalk.MIN_SPEED <= speed <= AquesTalk.MAX_SPEED:
+            raise ValueError(f"Speed must be between {AquesTalk.MIN_SPEED} "
+                             f"and {AquesTalk.MAX_SPEED}")
+
+        job = SynthesisJob(phonemes, voice, speed, priority, tenant, None)
+        if deadline is not None:
+            job.deadline = job.submitted + deadline
+
+        with self._lock:
+            if self._closed:
+                raise AquesTalkError("Scheduler is shut down")
+            tenants = self._queues[voice][priority]
+            if tenant not in tenants:
+                tenants[tenant] = deque()
+            tenants[tenant].append(job)
+            self._conds[voice].notify()
+        return job
+
+    def synthesize(self, phonemes: str, **kwargs) -> AquesAudio:
+        """Submit a request and wait for its audio. See submit()."""
+        return self.submit(phonemes, **kwargs).result()
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _next_job(self, voice: str) -> Optional[SynthesisJob]:
+        """Pop the next job for voice. Caller holds the lock."""
+        for priority in sorted(self._queues[voice]):
+            tenants = self._queues[voice][priority]
+            while tenants:
+                tenant, jobs = next(iter(tenants.items()))
+                job = jobs.popleft()
+                # Rotate the tenant to the back of the round-robin order
+                del tenants[tenant]
+                if jobs:
+                    tenants[tenant] = jobs
+                return job
+        return None
+
+    def _estimate(self, job: SynthesisJob, speed: int) -> float:
+        """Predicted service time for job at speed (0 if unknown)."""
+        rate = self._rate[job.voice]
+        if rate is None:
+            return 0.0
+        return rate * len(job.phonemes) * AquesTalk.DEFAULT_SPEED / speed
+
+    def _admit(self, job: SynthesisJob) -> bool:
+        """
+        Apply the deadline policy to a dequeued job. Caller holds the lock.
+
+        A dropped job is only recorded here; the caller fails its future
+        after releasing the lock, since done-callbacks run inside
+        set_exception() and may submit to this scheduler.
+
+        Returns:
+            False if the job was dropped
+        """
+        if job.deadline is None:
+            return True
+
+        now = time.monotonic()
+        if now + self._estimate(job, job.speed) <= job.deadline:
+            return True
+
+        if self.on_late == 'degrade' and now < job.deadline:
+            speed = min(AquesTalk.MAX_SPEED, int(job.speed * self.degrade_factor))
+            if speed > job.speed and now + self._estimate(job, speed) <= job.deadline:
+                job.speed = speed
+                job.degraded = True
+                self._stats[job.priority].degraded += 1
+                return True
+
+        # Dropped jobs still count towards queue wait: they are the tail
+        stats = self._stats[job.priority]
+        stats.dropped += 1
+        stats.queue_wait.append(now - job.submitted)
+        return False
+
+    def _work(self, voice: str, engine) -> None:
+        """Worker loop bound to one engine slot."""
+        cond = self._conds[voice]
+        while True:
+            with cond:
+                while True:
+                    if self._closed:
+                        return
+                    job = self._next_job(voice)
+                    if job is None:
+                        cond.wait()
+                    elif job.future.set_running_or_notify_cancel():
+                        break
+                admitted = self._admit(job)
+                if admitted:
+                    job.started = time.monotonic()
+
+            if not admitted:
+                job.future.set_exception(DeadlineExceeded(
+                    f"Deadline exceeded after {time.monotonic() - job.submitted:.3f}s"
+                    " in queue"))
+                continue
+
+            try:
+                audio = engine.synthesize(job.phonemes, 'utf-8', job.speed)
+            except Exception as e:
+                job.finished = time.monotonic()
+                with self._lock:
+                    stats = self._stats[job.priority]
+                    stats.failed += 1
+                    stats.queue_wait.append(job.queue_wait)
+                job.future.set_exception(e)
+                continue
+
+            job.finished = time.monotonic()
+            with self._lock:
+                stats = self._stats[job.priority]
+                stats.completed += 1
+                stats.queue_wait.append(job.queue_wait)
+                stats.service_time.append(job.service_time)
+                sample = job.service_time * job.speed / (
+                    AquesTalk.DEFAULT_SPEED * len(job.phonemes))
+                rate = self._rate[voice]
+                self._rate[voice] = sample if rate is None else (
+                    rate + self._EWMA_ALPHA * (sample - rate))
+            job.future.set_result(audio)
+
+    # ------------------------------------------------------------------
+    # Reporting and lifecycle
+    # ------------------------------------------------------------------
+
+    def queued(self) -> Dict[str, int]:
+        """Number of waiting requests per priority class."""
+        with self._lock:
+            counts = {name: 0 for name in self._CLASS_NAMES.values()}
+            for classes in self._queues.values():
+                for priority, tenants in classes.items():
+                    counts[self._CLASS_NAMES[priority]] += sum(
+                        len(jobs) for jobs in tenants.values())
+            return counts
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Per-class statistics.
+
+        Returns:
+            Mapping of class name to counters and p50/p99/max of queue
+            wait and service time, in seconds, over recent requests.
+            Queue wait includes dropped and failed requests.
+        """
+        with self._lock:
+            return {self._CLASS_NAMES[p]: s.snapshot()
+                    for p, s in self._stats.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting requests. Queued requests are cancelled.
+
+        Args:
+            wait: If True, wait for running native calls to finish
+        """
+        cancelled = []
+        with self._lock:
+            self._closed = True
+            for classes in self._queues.values():
+                for tenants in classes.values():
+                    for jobs in tenants.values():
+                        cancelled.extend(jobs)
+                    tenants.clear()
+            for cond in self._conds.values():
+                cond.notify_all()
+        # Outside the lock, since cancel() runs done-callbacks
+        for job in cancelled:
+            job.future.cancel()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.shutdown()
@@ -0,0 +1,684 @@
+"""
+HTTP synthesis server for AquesTalk.
+
+Minimal HTTP/1.1 server built on asyncio (standard library only).
+Features persistent (keep-alive) connections, chunked phrase-by-phrase
+streaming, ETag/Cache-Control headers and admission control backed by
+a shared engine pool.
+
+Usage:
+    python -m aquestalk.server --voice f1=D:\\aqtk1_win\\lib64\\f1\\AquesTalk.dll
+    python -m aquestalk.server --lib-dir D:\\aqtk1_win\\lib64 --port 8080
+    python -m aquestalk.server --stub          # no native library needed
+
+Endpoints:
+    GET  /voices                          List available voices
+    GET  /health                          Pool status
+    GET  /synthesize?koe=...&voice=f1&speed=100&format=wav&stream=0
+    POST /synthesize?voice=f1             Phoneme string as UTF-8 body
+
+    /synthesize also accepts priority (interactive/normal/batch), deadline
+    (seconds) and tenant (or an X-Tenant header), which are passed to the
+    SynthesisScheduler behind the engine pool.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from .core import AquesTalk, AquesAudio, AquesTalkError
+from .audio import audio_to_numpy, _wav_header
+from . import phonemes as lexer
+from .scheduler import DeadlineExceeded, SynthesisScheduler
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    422: 'Unprocessable Entity',
+    429: 'Too Many Requests',
+    431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+_PRIORITIES = {
+    'interactive': SynthesisScheduler.INTERACTIVE,
+    'normal': SynthesisScheduler.NORMAL,
+    'batch': SynthesisScheduler.BATCH,
+}
+
+_CONTENT_TYPES = {
+    'wav': 'audio/wav',
+    'pcm': 'audio/L16;rate=%d;channels=1' % AquesTalk.SAMPLE_RATE,
+}
+
+
+class StubEngine:
+    """
+    Stand-in for AquesTalk that needs no native library.
+
+    Produces silence whose length is proportional to the phoneme string,
+    so the server can be exercised locally.
+    """
+
+    def __init__(self, ms_per_char: int = 80, delay: float = 0.0):
+        """
+        Args:
+            ms_per_char: Milliseconds of audio generated per character
+            delay: Seconds to block per call, simulating synthesis time
+        """
+        self.ms_per_char = ms_per_char
+        self.delay = delay
+
+    def synthesize(self, phonemes: str, encoding: str = 'utf-8',
+                   speed: int = AquesTalk.DEFAULT_SPEED) -> AquesAudio:
+        """Return a silent WAV clip for phonemes."""
+        if not phonemes:
+            raise ValueError("Phoneme string cannot be empty")
+        if self.delay:
+            time.sleep(self.delay)
+        num_samples = (len(phonemes) * self.ms_per_char * AquesTalk.SAMPLE_RATE
+                       * 100 // (1000 * speed))
+        pcm = bytes(num_samples * 2)
+        return AquesAudio(data=_wav_header(len(pcm), AquesTalk.SAMPLE_RATE) + pcm,
+                          sample_rate=AquesTalk.SAMPLE_RATE)
+
+
+class EnginePool:
+    """
+    Shared engine pool with admission control for the HTTP server.
+
+    Native calls are dispatched by a SynthesisScheduler, so HTTP requests
+    get priority classes, per-tenant fair sharing and deadlines. At most
+    ``max_pending`` requests are admitted at once; further requests are
+    rejected instead of queued without bound.
+
+    Requests that cannot meet their deadline are dropped rather than
+    degraded, so a response is always determined by its parameters and
+    stays cacheable.
+    """
+
+    def __init__(self, engines: Dict[str, Union[object, Sequence[object]]],
+                 max_pending: int = 32, max_inflight: int = 1):
+        """
+        Args:
+            engines: Mapping of voice name to an engine or list of engines.
+                    Engines must provide ``synthesize(phonemes, encoding, speed)``.
+            max_pending: Maximum number of admitted requests
+            max_inflight: Maximum concurrent native calls per engine
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.scheduler = SynthesisScheduler(engines, max_inflight=max_inflight)
+        self.max_pending = max_pending
+        self.pending = 0
+
+    @property
+    def voices(self) -> List[str]:
+        """Names of available voices."""
+        return self.scheduler.voices
+
+    def try_admit(self) -> bool:
+        """Reserve an admission slot. Returns False when overloaded."""
+        if self.pending >= self.max_pending:
+            return False
+        self.pending += 1
+        return True
+
+    def release(self) -> None:
+        """Release a slot reserved by try_admit()."""
+        self.pending -= 1
+
+    async def synthesize(self, voice: str, phonemes: str, speed: int,
+                         priority: int = SynthesisScheduler.NORMAL,
+                         tenant: str = '',
+                         deadline: Optional[float] = None) -> AquesAudio:
+        """
+        Synthesize phonemes through the scheduler.
+
+        Args:
+            deadline: Seconds from now by which synthesis must finish
+
+        Raises:
+            DeadlineExceeded: If the request was dropped
+            AquesTalkError: If synthesis fails
+        """
+        job = self.scheduler.submit(phonemes, voice=voice, speed=speed,
+                                    priority=priority, tenant=tenant,
+                                    deadline=deadline)
+        return await asyncio.wrap_future(job.future)
+
+    def status(self) -> dict:
+        """Snapshot of admission, queue and latency statistics."""
+        return {
+            'pending': self.pending,
+            'max_pending': self.max_pending,
+            'voices': self.voices,
+            'queued': self.scheduler.queued(),
+            'stats': self.scheduler.stats(),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the scheduler, cancelling queued requests."""
+        self.scheduler.shutdown(wait=False)
+
+
+class _HttpError(Exception):
+    """Error mapped directly to an HTTP status."""
+
+    def __init__(self, status: int, message: str = ''):
+        self.status = status
+        self.message = message or _REASONS.get(status, '')
+        super().__init__(self.message)
+
+
+class _Request:
+    """Parsed HTTP request."""
+
+    __slots__ = ('method', 'path', 'params', 'headers', 'body', 'keep_alive')
+
+    def __init__(self, method, path, params, headers, body, keep_alive):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.headers = headers
+        self.body = body
+        self.keep_alive = keep_alive
+
+
+class _Params(NamedTuple):
+    """Validated /synthesize parameters."""
+    phonemes: str
+    voice: str
+    speed: int
+    fmt: str
+    stream: bool
+    priority: int
+    tenant: str
+    deadline: Optional[float]
+
+
+class SynthesisServer:
+    """
+    Asyncio HTTP server exposing AquesTalk synthesis.
+
+    Example:
+        pool = EnginePool({'f1': AquesTalk(path_f1)})
+        server = SynthesisServer(pool, port=8080)
+        server.run()
+    """
+
+    MAX_HEADER_LINES = 100
+    MAX_LINE = 8192
+
+    def __init__(self, pool: EnginePool, host: str = '127.0.0.1',
+                 port: int = 8080, keepalive_timeout: float = 15.0,
+                 max_body: int = 64 * 1024, max_age: int = 86400,
+                 validate: bool = False):
+        """
+        Args:
+            pool: Engine pool serving synthesis calls
+            host: Interface to bind
+            port: Port to bind (0 selects a free port)
+            keepalive_timeout: Seconds an idle connection is kept open,
+                              also the limit for reading one request
+            max_body: Maximum request body size in bytes
+            max_age: Cache-Control max-age for audio responses in seconds
+            validate: Reject phoneme strings with 400 before they reach an
+                     engine if aquestalk.phonemes reports errors. Off by
+                     default, since the validator only understands kana
+                     notation and rejects ASCII Roman input.
+        """
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.keepalive_timeout = keepalive_timeout
+        self.max_body = max_body
+        self.max_age = max_age
+        self.validate = validate
+        self._server = None
+
+    async def start(self) -> None:
+        """Start listening. Updates ``port`` if 0 was requested."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=self.MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Serving on http://%s:%d (voices: %s)",
+                    self.host, self.port, ', '.join(self.pool.voices))
+
+    async def close(self) -> None:
+        """Stop listening and shut the pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.pool.shutdown()
+
+    async def serve_forever(self) -> None:
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def run(self) -> None:
+        """Blocking entry point; stops on Ctrl+C."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until it is closed."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except _HttpError as e:
+                    await self._send_error(writer, e.status, e.message, False)
+                    break
+                if request is None:
+                    break
+                if not await self._dispatch(request, writer):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            logger.exception("Connection handler failed")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[_Request]:
+        """
+        Read one request. Returns None on EOF or timeout.
+
+        The whole request, headers and body included, must arrive within
+        keepalive_timeout, so a stalled client cannot hold a connection.
+        """
+        try:
+            return await asyncio.wait_for(self._parse_request(reader),
+                                          self.keepalive_timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _parse_request(self, reader: asyncio.StreamReader) -> Optional[_Request]:
+        """Read and parse one request without a time limit."""
+        try:
+            line = await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise _HttpError(431, "Request line too long")
+        if not line:
+            return None
+
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3 or not parts[2].startswith('HTTP/1.'):
+            raise _HttpError(400, "Malformed request line")
+        method, target, version = parts
+
+        headers = {}
+        for _ in range(self.MAX_HEADER_LINES):
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                raise _HttpError(431)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, sep, value = line.decode('latin-1').partition(':')
+            if not sep:
+                raise _HttpError(400, "Malformed header")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise _HttpError(431)
+
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            keep_alive = connection == 'keep-alive'
+        else:
+            keep_alive = connection != 'close'
+
+        body = b''
+        if 'transfer-encoding' in headers:
+            raise _HttpError(400, "Chunked request bodies are not supported")
+        if 'content-length' in headers:
+            try:
+                length = int(headers['content-length'])
+            except ValueError:
+                raise _HttpError(400, "Invalid Content-Length")
+            if length < 0:
+                raise _HttpError(400, "Invalid Content-Length")
+            if length > self.max_body:
+                raise _HttpError(413)
+            body = await reader.readexactly(length)
+
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        return _Request(method.upper(), url.path, params, headers, body, keep_alive)
+
+    async def _dispatch(self, request: _Request,
+                        writer: asyncio.StreamWriter) -> bool:
+        """Route a request. Returns True if the connection stays open."""
+        try:
+            if request.path == '/synthesize':
+                if request.method not in ('GET', 'POST'):
+                    raise _HttpError(405)
+                return await self._synthesize(request, writer)
+
+            if request.method != 'GET':
+                raise _HttpError(405)
+            if request.path == '/voices':
+                body = {'voices': self.pool.voices}
+            elif request.path == '/health':
+                body = self.pool.status()
+            else:
+                raise _HttpError(404)
+            data = json.dumps(body).encode('utf-8')
+            await self._send(writer, 200, {'Content-Type': 'application/json'},
+                             data, request.keep_alive)
+            return request.keep_alive
+
+        except _HttpError as e:
+            headers = {'Retry-After': '1'} if e.status in (429, 503) else None
+            await self._send_error(writer, e.status, e.message,
+                                   request.keep_alive, headers)
+            return request.keep_alive
+        except (ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception:
+            # Raised before any part of the response was written
+            logger.exception("Error handling %s %s", request.method, request.path)
+            await self._send_error(writer, 500, _REASONS[500], False)
+            return False
+
+    # ------------------------------------------------------------------
+    # Synthesis
+    # ------------------------------------------------------------------
+
+    def _parse_synthesis_params(self, request: _Request) -> _Params:
+        """Extract and validate /synthesize parameters."""
+        params = dict(request.params)
+        if request.method == 'POST' and request.body:
+            content_type = request.headers.get('content-type', '')
+            try:
+                text = request.body.decode('utf-8')
+            except UnicodeDecodeError:
+                raise _HttpError(400, "Body must be UTF-8")
+            if content_type.startswith('application/x-www-form-urlencoded'):
+                params.update(parse_qsl(text, keep_blank_values=True))
+            else:
+                params['koe'] = text
+
+        phonemes = params.get('koe', '').strip()
+        if not phonemes:
+            raise _HttpError(400, "Missing phoneme string (koe)")
+        if self.validate:
+            errors = lexer.validate(phonemes)
+            if errors:
+                raise _HttpError(400, f"Invalid phoneme string at position "
+                                      f"{errors[0].position}: {errors[0].message}")
+
+        voices = self.pool.voices
+        voice = params.get('voice', voices[0])
+        if voice not in voices:
+            raise _HttpError(404, f"Unknown voice: {voice}")
+
+        try:
+            speed = int(params.get('speed', AquesTalk.DEFAULT_SPEED))
+        except ValueError:
+            raise _HttpError(400, "Speed must be an integer")
+        if not AquesTalk.MIN_SPEED <= speed <= AquesTalk.MAX_SPEED:
+            raise _HttpError(400, f"Speed must be between {AquesTalk.MIN_SPEED} "
+                                  f"and {AquesTalk.MAX_SPEED}")
+
+        fmt = params.get('format', 'wav').lower()
+        if fmt not in _CONTENT_TYPES:
+            raise _HttpError(400, f"Unsupported format: {fmt}")
+
+        stream = params.get('stream', '0').lower() in ('1', 'true', 'yes')
+
+        priority = _PRIORITIES.get(params.get('priority', 'normal').lower())
+        if priority is None:
+            raise _HttpError(400, "Priority must be one of: " + ', '.join(_PRIORITIES))
+
+        deadline = params.get('deadline')
+        if deadline is not None:
+            try:
+                deadline = float(deadline)
+            except ValueError:
+                raise _HttpError(400, "Deadline must be a number of seconds")
+            if deadline <= 0:
+                raise _HttpError(400, "Deadline must be positive")
+
+        tenant = params.get('tenant') or request.headers.get('x-tenant', '')
+        return _Params(phonemes, voice, speed, fmt, stream, priority, tenant, deadline)
+
+    @staticmethod
+    def _etag(phonemes: str, voice: str, speed: int, fmt: str, stream: bool) -> str:
+        """Strong ETag derived from everything that determines the response."""
+        key = '\0'.join((voice, str(speed), fmt, str(int(stream)), phonemes))
+        return '"%s"' % hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+    async def _synthesize(self, request: _Request,
+                          writer: asyncio.StreamWriter) -> bool:
+        """Handle /synthesize."""
+        params = self._parse_synthesis_params(request)
+
+        # Only GET responses are cacheable and support conditional requests
+        if request.method == 'GET':
+            etag = self._etag(params.phonemes, params.voice, params.speed,
+                              params.fmt, params.stream)
+            cache_headers = {
+                'ETag': etag,
+                'Cache-Control': f'public, max-age={self.max_age}',
+            }
+            if_none_match = request.headers.get('if-none-match', '')
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            if etag in tags or if_none_match == '*':
+                await self._send(writer, 304, cache_headers, b'', request.keep_alive)
+                return request.keep_alive
+        else:
+            cache_headers = {'Cache-Control': 'no-store'}
+
+        if not self.pool.try_admit():
+            raise _HttpError(429, "Server is busy")
+        try:
+            headers = dict(cache_headers)
+            headers['Content-Type'] = _CONTENT_TYPES[params.fmt]
+            if params.stream:
+                return await self._send_stream(writer, params, headers,
+                                               request.keep_alive)
+
+            audio = await self._synthesize_phrase(params, params.phonemes)
+            if params.fmt == 'wav':
+                data = audio.data
+            else:
+                data = audio_to_numpy(audio).tobytes()
+            await self._send(writer, 200, headers, data, request.keep_alive)
+            return request.keep_alive
+        finally:
+            self.pool.release()
+
+    async def _synthesize_phrase(self, params: _Params, phonemes: str,
+                                 expires: Optional[float] = None) -> AquesAudio:
+        """
+        Synthesize one phrase, mapping engine errors to HTTP errors.
+
+        Args:
+            expires: Monotonic time by which the whole request must finish
+                    (defaults to now + params.deadline)
+        """
+        deadline = params.deadline
+        if expires is not None:
+            deadline = max(0.0, expires - time.monotonic())
+        try:
+            return await self.pool.synthesize(params.voice, phonemes, params.speed,
+                                              params.priority, params.tenant,
+                                              deadline)
+        except DeadlineExceeded as e:
+            raise _HttpError(503, str(e))
+        except (AquesTalkError, ValueError) as e:
+            raise _HttpError(422, str(e))
+
+    async def _send_stream(self, writer: asyncio.StreamWriter, params: _Params,
+                           headers: dict, keep_alive: bool) -> bool:
+        """Stream audio phrase by phrase using chunked transfer encoding."""
+        phrases = lexer.split(params.phonemes)
+        expires = None
+        if params.deadline is not None:
+            expires = time.monotonic() + params.deadline
+
+        # Synthesize the first phrase before committing to a 200 response,
+        # so that bad input still gets a proper error status.
+        audio = await self._synthesize_phrase(params, phrases[0], expires)
+
+        headers['Transfer-Encoding'] = 'chunked'
+        writer.write(self._head(200, headers, keep_alive))
+        if params.fmt == 'wav':
+            # Length is unknown up front; use the streaming WAV convention
+            self._write_chunk(writer, _wav_header(0xFFFFFFFF, audio.sample_rate,
+                                                  audio.bits_per_sample,
+                                                  audio.channels))
+
+        for i in range(len(phrases)):
+            if i > 0:
+                try:
+                    audio = await self._synthesize_phrase(params, phrases[i], expires)
+                except Exception as e:
+                    # Status already sent; abort without the final chunk so
+                    # the client sees an incomplete response.
+                    logger.warning("Stream aborted at phrase %d: %s", i, e)
+                    return False
+            self._write_chunk(writer, audio_to_numpy(audio).tobytes())
+            await writer.drain()
+
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+        return keep_alive
+
+    # ------------------------------------------------------------------
+    # Response helpers
+    # ------------------------------------------------------------------
+
+    def _head(self, status: int, headers: Optional[dict], keep_alive: bool) -> bytes:
+        """Serialize status line and headers."""
+        lines = [f'HTTP/1.1 {status} {_REASONS.get(status, "")}',
+                 'Server: aquestalk']
+        for name, value in (headers or {}).items():
+            lines.append(f'{name}: {value}')
+        if keep_alive:
+            lines.append('Connection: keep-alive')
+            lines.append(f'Keep-Alive: timeout={int(self.keepalive_timeout)}')
+        else:
+            lines.append('Connection: close')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    @staticmethod
+    def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+        if data:
+            writer.write(b'%X\r\n' % len(data) + data + b'\r\n')
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int,
+                    headers: Optional[dict], body: bytes, keep_alive: bool) -> None:
+        """Send a complete response with Content-Length."""
+        headers = dict(headers or {})
+        if status != 304:
+            headers['Content-Length'] = str(len(body))
+        writer.write(self._head(status, headers, keep_alive) + body)
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, status: int,
+                          message: str, keep_alive: bool,
+                          headers: Optional[dict] = None) -> None:
+        """Send a JSON error response."""
+        headers = dict(headers or {})
+        headers['Content-Type'] = 'application/json'
+        body = json.dumps({'error': message, 'status': status}).encode('utf-8')
+        await self._send(writer, status, headers, body, keep_alive)
+
+
+def _find_voices(lib_dir: str) -> Dict[str, str]:
+    """Map voice names to library paths (``<lib_dir>/<voice>/AquesTalk.dll``)."""
+    voices = {}
+    for name in sorted(os.listdir(lib_dir)):
+        for lib_name in AquesTalk._LIB_NAMES.get(sys.platform, ['AquesTalk.dll']):
+            path = os.path.join(lib_dir, name, lib_name)
+            if os.path.isfile(path):
+                voices[name] = path
+                break
+    return voices
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog='python -m aquestalk.server',
+        description='HTTP server for AquesTalk speech synthesis')
+    parser.add_argument('--voice', action='append', default=[], metavar='NAME=PATH',
+                        help='Voice name and library path (repeatable)')
+    parser.add_argument('--lib-dir', help='Directory with one subdirectory per voice')
+    parser.add_argument('--stub', action='store_true',
+                        help='Serve silent audio without a native library')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--max-pending', type=int, default=32,
+                        help='Requests admitted before answering 429')
+    parser.add_argument('--max-inflight', type=int, default=1,
+                        help='Concurrent native calls per engine')
+    parser.add_argument('--keepalive-timeout', type=float, default=15.0)
+    parser.add_argument('--max-age', type=int, default=86400,
+                        help='Cache-Control max-age in seconds')
+    parser.add_argument('--validate', action='store_true',
+                        help='Reject malformed kana phoneme strings with 400 '
+                             '(Roman notation is rejected too)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    paths = {}
+    if args.lib_dir:
+        paths.update(_find_voices(args.lib_dir))
+    for spec in args.voice:
+        name, sep, path = spec.partition('=')
+        if not sep:
+            parser.error(f"--voice expects NAME=PATH, got: {spec}")
+        paths[name] = path
+
+    if args.stub:
+        engines = {name: StubEngine() for name in (paths or {'stub': None})}
+    elif paths:
+        engines = {name: AquesTalk(path) for name, path in paths.items()}
+    else:
+        parser.error("No voices configured (use --voice, --lib-dir or --stub)")
+
+    pool = EnginePool(engines, max_pending=args.max_pending,
+                      max_inflight=args.max_inflight)
+    server = SynthesisServer(pool, host=args.host, port=args.port,
+                             keepalive_timeout=args.keepalive_timeout,
+                             max_age=args.max_age, validate=args.validate)
+    server.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Tests for aquestalk.audio post-processing.
+"""
+
+import ctypes
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from aquestalk import AquesTalk, PostProcessor, audio_to_numpy, numpy_to_audio
+
+
+def tone(length, amplitude, lead=0, tail=0):
+    """Alternating-sign tone of given length surrounded by digital silence."""
+    samples = np.full(length, amplitude, dtype=np.int16)
+    samples[1::2] *= -1
+    return np.concatenate([np.zeros(lead, np.int16), samples, np.zeros(tail, np.int16)])
+
+
+def test_batch_matches_per_clip():
+    rng = np.random.default_rng(0)
+    clips = [tone(int(n), int(a), int(l), int(t)) for n, a, l, t in zip(
+        rng.integers(1, 400, 50), rng.integers(100, 30000, 50),
+        rng.integers(0, 300, 50), rng.integers(0, 300, 50))]
+    clips += [np.zeros(0, np.int16), np.zeros(100, np.int16), tone(3, 20000)]
+    for post in (PostProcessor(), PostProcessor(normalize='rms', target_db=-20.0)):
+        batch = post.process_arrays(clips)
+        for clip, result in zip(clips, batch):
+            np.testing.assert_array_equal(result, post.process_arrays([clip])[0])
+
+
+def test_empty_and_silent_clips():
+    post = PostProcessor()
+    empty, silent = post.process_arrays([np.zeros(0, np.int16), np.zeros(100, np.int16)])
+    assert len(empty) == 0
+    np.testing.assert_array_equal(silent, np.zeros(100, np.int16))
+
+
+def test_noise_below_threshold_is_not_amplified():
+    rng = np.random.default_rng(1)
+    noise = (rng.standard_normal(200) * 15).astype(np.int16)
+    result = PostProcessor(fade_in_ms=0, fade_out_ms=0).process_arrays([noise])[0]
+    np.testing.assert_array_equal(result, noise)
+
+
+def test_trim_keeps_pad():
+    clip = tone(50, 10000, lead=100, tail=100)
+    post = PostProcessor(pad_ms=5, normalize=None, fade_in_ms=0, fade_out_ms=0)
+    result = post.process_arrays([clip], sample_rate=8000)[0]
+    # 5 ms at 8 kHz is 40 samples on each side
+    np.testing.assert_array_equal(result, clip[60:190])
+
+
+def test_gain_never_clips():
+    clip = tone(400, 10)
+    clip[200] = 10000
+    post = PostProcessor(trim=False, normalize='rms', target_db=-1.0,
+                         fade_in_ms=0, fade_out_ms=0)
+    result = post.process_arrays([clip])[0]
+    assert np.abs(result.astype(np.int32)).max() == 32767
+
+
+def test_fade_directions():
+    clip = np.full(800, 10000, dtype=np.int16)
+    post = PostProcessor(trim=False, normalize=None, fade_in_ms=5, fade_out_ms=5)
+    result = post.process_arrays([clip], sample_rate=8000)[0]
+    assert np.all(np.diff(result[:40]) > 0)
+    assert np.all(np.diff(result[-40:]) < 0)
+    assert np.all(result[40:-40] == 10000)
+
+
+class _Function:
+    """Fake ctypes function returning a fixed WAV buffer."""
+
+    def __init__(self, data):
+        self.buffer = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+
+    def __call__(self, koe, speed, size):
+        size._obj.value = len(self.buffer)
+        return ctypes.cast(self.buffer, ctypes.POINTER(ctypes.c_ubyte))
+
+
+class _Library:
+    def __init__(self, data):
+        self.AquesTalk_Synthe_Utf8 = _Function(data)
+        self.freed = 0
+
+    def AquesTalk_FreeWave(self, ptr):
+        self.freed += 1
+
+
+def test_synthesize_applies_postprocess():
+    synth = AquesTalk.__new__(AquesTalk)
+    synth._lib = _Library(numpy_to_audio(tone(80, 3000, lead=400, tail=400)).data)
+    synth._is_initialized = True
+    post = PostProcessor(pad_ms=0, fade_in_ms=0, fade_out_ms=0)
+
+    samples = audio_to_numpy(synth.synthesize("あ。", postprocess=post))
+    assert len(samples) == 80
+    assert np.abs(samples.astype(np.int32)).max() == round(32767 * 10 ** (-1 / 20))
+    assert synth._lib.freed == 1
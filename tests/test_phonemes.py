@@ -0,0 +1,112 @@
+"""
+Tests for aquestalk.phonemes, using the examples of siyo_onseikigou.pdf.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from aquestalk import PhonemeError, validate_many
+from aquestalk.phonemes import check, split, validate
+
+# Section 4 samples
+SAMPLES = [
+    "でんわば'んごーわ、<NUM VAL=01-2345-6789>です。",
+    "さーばー;<NUM VAL=3512>の/はーどでぃ'_ス_クに、え'らー+はっせー。",
+    "げつよ'ーの/<NUMK VAL=21 COUNTER=じ>から、<NUMK VAL=8 COUNTER=ちゃ'んねる>で/よやく+しま'した。",
+    "りょ'ーきんわ;<NUMK VAL=550 COUNTER=えん>です。",
+    "すみませ'ん、<NUMK VAL=10 COUNTER=ふん>+おくれま'す。",
+    "<NUMK VAL=20 COUNTER=ふん>に、え'きで/ま'ってます。",
+    "あすのて'んき、とーきょー、はれ'のち+くもり、さいこーき'おん、<NUMK VAL=25 COUNTER=ど>。",
+    "<NUMK VAL=100 COUNTER=め'ーとる>さき、こーえんいりぐちの/こーさてんを+ひだりで'す。",
+    "このさき;<NUMK VAL=3 COUNTER=きろ>/じゅーたいちゅー。つーかじ'かん;<NUMK VAL=10 COUNTER=ふん>、",
+    "よろし'いですか？",
+    "これでい'い？",
+    "ばってりーの/じゅーでん+かんりょー。",
+    "<NUMK VAL=2006 COUNTER=ねん>、<NUMK VAL=1 COUNTER=がつ>;<NUMK VAL=15 COUNTER=にち>。",
+    "<NUMK VAL=16 COUNTER=じ>;<NUMK VAL=5 COUNTER=ふん>/<NUMK VAL=35 COUNTER=びょー>です。",
+    "それから'わ、やまぐち'けんで;やとわれば'んとーお/するよ'ーに+な'り、"
+    "か'ぞくの/もと'にわ、ほと'んど;もどれ'なく+なりま'した。",
+    "ばくおんが、ぎんせ'かいの/こーげんに/ひろがる。",
+    # Section 3.7 (v2.0): repeated and leading delimiters
+    "お'んせーで/;あんな'いします。",
+    "+お'んせーで/あんな'いします。",
+    # Section 3.8 rule 1 was lifted in v2.0
+    "あっ。",
+]
+
+
+@pytest.mark.parametrize("phonemes", SAMPLES)
+def test_spec_samples_are_valid(phonemes):
+    assert validate(phonemes, warnings=True) == []
+
+
+@pytest.mark.parametrize("phonemes, position", [
+    ("えっっと。", 2),
+    ("えっッと。", 2),
+    ("ーか。", 0),
+    ("わたし;ーわ、", 4),
+    ("えっー。", 2),
+    ("ナイ_スー。", 4),
+    ("あ_キや。", 3),
+])
+def test_spec_counter_examples_are_rejected(phonemes, position):
+    errors = validate(phonemes)
+    assert [e.position for e in errors] == [position]
+
+
+def test_accent_cannot_split_a_symbol():
+    with pytest.raises(PhonemeError) as info:
+        check("じ'ゅ。")
+    assert info.value.position == 2
+
+
+def test_one_accent_per_phrase():
+    errors = validate("か'き'く。")
+    assert [(e.position, e.message) for e in errors] == [
+        (3, "Only one accent mark is allowed per accent phrase")]
+    assert validate("か'き/く'。") == []
+
+
+@pytest.mark.parametrize("phonemes", [
+    "<FOO VAL=1>。",
+    "<NUM VAL=1a>。",
+    "<NUMK VAL=12345678901234567>。",
+    "<NUMK VAL=3 COUNTER=abc>。",
+    "<ALPHA VAL=あ>。",
+    "<NUM VAL=" + "1" * 300 + ">。",
+])
+def test_tag_errors(phonemes):
+    errors = validate(phonemes)
+    assert len(errors) == 1
+    assert errors[0].position == 0
+    assert errors[0].length == phonemes.index('>') + 1
+
+
+def test_unterminated_tag_stops_diagnostics():
+    errors = validate("あ<NUM VAL=1。ぢ")
+    assert [(e.position, e.message) for e in errors] == [(1, "Unterminated tag")]
+
+
+def test_validate_many_deduplicates():
+    rows = ["あ。", "ーか。", "あ。", "ーか。"]
+    results = validate_many(rows)
+    assert [len(r) for r in results] == [0, 1, 0, 1]
+    assert results[1] is results[3]
+
+
+@pytest.mark.parametrize("phonemes, parts", [
+    ("あ。い？", ["あ。", "い？"]),
+    ("あ。。", ["あ。。"]),
+    ("。あ。", ["。あ。"]),
+    ("あ。、い。", ["あ。、", "い。"]),
+    ("あ。い", ["あ。", "い"]),
+    ("<NUM VAL=1.5>。う。", ["<NUM VAL=1.5>。", "う。"]),
+])
+def test_split_never_yields_delimiter_only_parts(phonemes, parts):
+    assert split(phonemes) == parts
+    for part in parts:
+        assert validate(part) == []
@@ -0,0 +1,69 @@
+"""
+Tests for aquestalk.pipeline.
+"""
+
+import os
+import queue
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from aquestalk import AquesAudio, TextToSpeechPipeline
+
+
+class Engine:
+    """Engine stub failing on the phoneme string "boom"."""
+
+    def synthesize(self, phonemes, speed=100):
+        if phonemes == "boom":
+            raise RuntimeError("synthesis failed")
+        return AquesAudio(data=phonemes.encode('utf-8'))
+
+
+def frontend(text):
+    if text == "bad":
+        raise ValueError("conversion failed")
+    return text
+
+
+def test_results_in_order_and_cached():
+    pipeline = TextToSpeechPipeline(frontend, Engine())
+    results = [a.data for a in pipeline.run(["a", "b", "a", "c"])]
+    assert results == [b"a", b"b", b"a", b"c"]
+    assert pipeline.cache.hits == 1
+
+
+def test_error_stops_run_by_default():
+    pipeline = TextToSpeechPipeline(frontend, Engine())
+    with pytest.raises(ValueError):
+        list(pipeline.run(["a", "bad", "b"]))
+
+
+def test_return_exceptions_isolates_failures():
+    pipeline = TextToSpeechPipeline(frontend, Engine())
+    results = list(pipeline.run(["a", "bad", "boom", "b"], return_exceptions=True))
+    assert results[0].data == b"a"
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], RuntimeError)
+    assert results[3].data == b"b"
+
+
+def test_close_with_blocked_input_does_not_hang():
+    messages = queue.Queue()
+    messages.put("a")
+
+    def chat():
+        while True:
+            yield messages.get()
+
+    pipeline = TextToSpeechPipeline(frontend, Engine())
+    pipeline.JOIN_TIMEOUT = 0.1
+    results = pipeline.run(chat())
+    assert next(results).data == b"a"
+
+    start = time.monotonic()
+    results.close()
+    assert time.monotonic() - start < 1.0
@@ -0,0 +1,125 @@
+"""
+Tests for aquestalk.server.
+"""
+
+import asyncio
+import os
+import sys
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from aquestalk.server import EnginePool, StubEngine, SynthesisServer
+
+
+class FailingEngine(StubEngine):
+    """Stub raising a non-AquesTalk error on phrases containing "ん"."""
+
+    def synthesize(self, phonemes, encoding='utf-8', speed=100):
+        if 'ん' in phonemes:
+            raise RuntimeError("engine crashed")
+        return super().synthesize(phonemes, encoding, speed)
+
+
+async def request(port, method, target, headers=None, body=b''):
+    """Send one request and return (status, headers, raw body)."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    lines = [f"{method} {target} HTTP/1.1", "Host: test", "Connection: close",
+             f"Content-Length: {len(body)}"]
+    lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body)
+    response = await reader.read()
+    writer.close()
+    head, _, rest = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode('latin-1').split("\r\n")
+    fields = dict(line.lower().split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), fields, rest
+
+
+def serve(engines, test, **options):
+    async def main():
+        server = SynthesisServer(EnginePool(engines), port=0, **options)
+        await server.start()
+        try:
+            await test(server.port)
+        finally:
+            await server.close()
+    asyncio.run(main())
+
+
+def test_get_is_cacheable_and_post_is_not():
+    koe = quote("あいう。")
+
+    async def test(port):
+        status, headers, _ = await request(port, 'GET', f"/synthesize?koe={koe}")
+        assert status == 200
+        etag = headers['etag']
+        status, _, _ = await request(port, 'GET', f"/synthesize?koe={koe}",
+                                     {'If-None-Match': etag})
+        assert status == 304
+
+        status, headers, _ = await request(port, 'POST', "/synthesize",
+                                           {'If-None-Match': etag},
+                                           "あいう。".encode('utf-8'))
+        assert status == 200
+        assert 'etag' not in headers
+        assert headers['cache-control'] == 'no-store'
+
+    serve({'f1': StubEngine()}, test)
+
+
+def test_engine_error_gives_500_or_aborts_stream():
+    async def test(port):
+        status, _, _ = await request(port, 'GET', f"/synthesize?koe={quote('ん。')}")
+        assert status == 500
+
+        koe = quote("あ。ん。")
+        status, _, body = await request(port, 'GET', f"/synthesize?koe={koe}&stream=1")
+        assert status == 200
+        assert not body.endswith(b"0\r\n\r\n")
+
+    serve({'f1': FailingEngine()}, test)
+
+
+def test_scheduler_parameters():
+    async def test(port):
+        status, _, _ = await request(port, 'GET',
+                                     f"/synthesize?koe={quote('あ。')}&priority=urgent")
+        assert status == 400
+        status, _, _ = await request(port, 'GET',
+                                     f"/synthesize?koe={quote('あ。')}&deadline=-1")
+        assert status == 400
+        status, _, _ = await request(port, 'GET',
+                                     f"/synthesize?koe={quote('あ。')}&priority=interactive"
+                                     "&deadline=5", {'X-Tenant': 'alice'})
+        assert status == 200
+
+    serve({'f1': StubEngine()}, test)
+
+
+def test_roman_notation_rejected_only_when_validating():
+    target = f"/synthesize?koe={quote('konnichiwa')}"
+
+    async def accepted(port):
+        status, _, _ = await request(port, 'GET', target)
+        assert status == 200
+
+    async def rejected(port):
+        status, _, body = await request(port, 'GET', target)
+        assert status == 400
+        assert b"Roman" in body
+
+    serve({'f1': StubEngine()}, accepted)
+    serve({'f1': StubEngine()}, rejected, validate=True)
+
+
+def test_stalled_request_is_closed():
+    async def test(port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        # Request line and a header, then nothing
+        writer.write(b"GET /voices HTTP/1.1\r\nHost: test\r\n")
+        await writer.drain()
+        assert await asyncio.wait_for(reader.read(), 2) == b""
+        writer.close()
+
+    serve({'f1': StubEngine()}, test, keepalive_timeout=0.2)